@@ -2,13 +2,14 @@
 Configuration settings for the LLM Memory System
 """
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 
 # Base directory
 BASE_DIR = Path(__file__).parent
 
 # API Configuration
-ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
 CLAUDE_MODEL = "claude-3-5-haiku-20241022"  # Claude 3.5 Haiku
 CLAUDE_MAX_TOKENS = 4000
 CLAUDE_TEMPERATURE = 0.1
@@ -24,6 +25,13 @@ SRC_DIR = BASE_DIR / "src"
 DEFAULT_LOG_DAYS = 7  # Process logs from last N days by default
 LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 LOG_LINE_PATTERN = r'\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\] (USER|ASSISTANT): (.*)'
+LOG_LINE_RE = re.compile(LOG_LINE_PATTERN)  # Compiled once; matched against the start of each line
+
+# Batch Processing Settings
+BATCH_POLL_INTERVAL = 30  # Seconds between Message Batches status checks
+
+# Response Cache Settings (development only; enable with MEM_CACHE=1)
+RESPONSE_CACHE_DIR = BASE_DIR / ".cache" / "claude_responses"
 
 # Memory Processing Settings
 MIN_CONVERSATION_LENGTH = 3  # Minimum exchanges to consider for memory updates
@@ -55,12 +63,27 @@ RESPONSE FORMAT PREFERENCES:
 # Validation Settings
 REQUIRED_ENV_VARS = ["ANTHROPIC_API_KEY"]
 
+# Snapshot of the process environment, taken once at import
+_ENV_CACHE: dict = {}
+
+def refresh_env_cache():
+    """Re-read the process environment (e.g. after tests modify os.environ)"""
+    _ENV_CACHE.clear()
+    _ENV_CACHE.update(os.environ)
+    get_anthropic_api_key.cache_clear()
+
+@lru_cache(maxsize=None)
+def get_anthropic_api_key():
+    """Get the Anthropic API key from the cached environment"""
+    return _ENV_CACHE.get("ANTHROPIC_API_KEY")
+
+def is_response_cache_enabled():
+    """Check whether the on-disk Claude response cache is enabled"""
+    return _ENV_CACHE.get("MEM_CACHE") == "1"
+
 def validate_config():
     """Validate that all required configuration is present"""
-    missing_vars = []
-    for var in REQUIRED_ENV_VARS:
-        if not os.getenv(var):
-            missing_vars.append(var)
+    missing_vars = [var for var in REQUIRED_ENV_VARS if not _ENV_CACHE.get(var)]
     
     if missing_vars:
         raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
@@ -69,8 +92,10 @@ def validate_config():
 
 def ensure_directories():
     """Ensure all required directories exist"""
-    directories = [LOGS_DIR, SCRIPTS_DIR, SRC_DIR]
-    for directory in directories:
-        directory.mkdir(exist_ok=True)
+    for directory in (LOGS_DIR, SCRIPTS_DIR, SRC_DIR):
+        os.makedirs(os.fspath(directory), exist_ok=True)
     
     return True
+
+# Populate the environment snapshot on import
+refresh_env_cache()
@@ -5,14 +5,17 @@ Memory System Demo
 Interactive demo showing how to integrate the memory system into a chatbot.
 """
 
+import io
 import sys
+import asyncio
 import logging
-from pathlib import Path
+from functools import cached_property
+import os
+from typing import List, Tuple
 
 # Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.claude_client import ClaudeClient
 from src.memory_manager import MemoryManager
 
 
@@ -25,13 +28,22 @@ class PersonalizedChatbot:
     """Example chatbot with memory integration"""
     
     def __init__(self):
-        self.claude_client = ClaudeClient()
-        self.memory_manager = MemoryManager()
         self.conversation_history = []
     
+    @cached_property
+    def claude_client(self):
+        """Claude client, created on the first chat turn that needs it"""
+        from src.claude_client import ClaudeClient
+        return ClaudeClient()
+    
+    @cached_property
+    def memory_manager(self):
+        """Memory manager, created on first memory access"""
+        return MemoryManager()
+    
     def get_response(self, user_input: str, use_memory: bool = True) -> str:
         """
-        Generate response with optional memory context
+        Generate response with optional memory context, streaming it to stdout
         
         Args:
             user_input: User's message
@@ -48,8 +60,9 @@ class PersonalizedChatbot:
             else:
                 prompt = f"User: {user_input}\n\nAssistant:"
             
-            # Get response from Claude
-            response = self.claude_client.client.messages.create(
+            # Stream response from Claude, printing text as it arrives
+            text_parts = []
+            with self.claude_client.client.messages.stream(
                 model=self.claude_client.model,
                 max_tokens=1000,
                 temperature=0.1,
@@ -59,13 +72,73 @@ class PersonalizedChatbot:
                         "content": prompt
                     }
                 ]
-            )
+            ) as stream:
+                for text in stream.text_stream:
+                    sys.stdout.write(text)
+                    sys.stdout.flush()
+                    text_parts.append(text)
+            
+            sys.stdout.write("\n")
+            return "".join(text_parts)
+            
+        except Exception as e:
+            error = f"Sorry, I encountered an error: {str(e)}"
+            print(error)
+            return error
+    
+    async def aget_response(self, client, user_input: str, memory_context: str = "") -> str:
+        """
+        Generate response asynchronously with optional memory context
+        
+        Args:
+            client: AsyncAnthropic client (see ClaudeClient.create_async_client)
+            user_input: User's message
+            memory_context: Memory context to include (empty for none)
+            
+        Returns:
+            Chatbot response
+        """
+        try:
+            # Build prompt
+            if memory_context:
+                prompt = f"{memory_context}\n\nUser: {user_input}\n\nAssistant:"
+            else:
+                prompt = f"User: {user_input}\n\nAssistant:"
             
-            return response.content[0].text
+            return await self.claude_client.agenerate_text(client, prompt)
             
         except Exception as e:
             return f"Sorry, I encountered an error: {str(e)}"
     
+    async def _aget_comparison_responses(self, user_inputs: List[str]) -> List[Tuple[str, str]]:
+        """Generate responses with and without memory for all inputs concurrently"""
+        memory_context = self.memory_manager.get_context_for_prompt()
+        
+        async with self.claude_client.create_async_client() as client:
+            responses = await asyncio.gather(*[
+                self.aget_response(client, user_input, context)
+                for user_input in user_inputs
+                for context in ("", memory_context)
+            ])
+        
+        return list(zip(responses[::2], responses[1::2]))
+    
+    def get_comparison_responses(self, user_inputs: List[str]) -> List[Tuple[str, str]]:
+        """
+        Generate responses with and without memory, issuing all requests concurrently
+        
+        Args:
+            user_inputs: User messages to respond to
+            
+        Returns:
+            List of (response_without, response_with) tuples in input order
+        """
+        try:
+            return asyncio.run(self._aget_comparison_responses(user_inputs))
+        except Exception as e:
+            error = f"Sorry, I encountered an error: {str(e)}"
+            return [(error, error) for _ in user_inputs]
+    
     def chat_session(self):
         """Run interactive chat session"""
         print("🤖 Personalized Chatbot Demo")
@@ -89,14 +162,12 @@ class PersonalizedChatbot:
                 if not user_input:
                     continue
                 
-                # Show both responses for comparison
+                # Show both responses for comparison, streamed as they arrive
                 print("\n🤖 Response WITHOUT memory:")
-                response_without = self.get_response(user_input, use_memory=False)
-                print(response_without)
+                self.get_response(user_input, use_memory=False)
                 
                 print("\n🧠 Response WITH memory:")
-                response_with = self.get_response(user_input, use_memory=True)
-                print(response_with)
+                self.get_response(user_input, use_memory=True)
                 
                 print("\n" + "-" * 40)
                 
@@ -134,21 +205,25 @@ def run_quick_demo():
             "How should I structure my code?"
         ]
         
-        for i, query in enumerate(test_queries, 1):
-            print(f"\n--- Example {i} ---")
-            print(f"User: {query}")
+        # Request every response concurrently, then print in order
+        responses = chatbot.get_comparison_responses(test_queries)
+        
+        for i, (query, (response_without, response_with)) in enumerate(zip(test_queries, responses), 1):
+            # Build each example in memory and write it once
+            buf = io.StringIO()
+            buf.write(f"\n--- Example {i} ---\n")
+            buf.write(f"User: {query}\n")
             
             # Response without memory
-            print(f"\n🤖 Standard Response:")
-            response_without = chatbot.get_response(query, use_memory=False)
-            print(response_without[:300] + ("..." if len(response_without) > 300 else ""))
+            buf.write("\n🤖 Standard Response:\n")
+            buf.write(response_without[:300] + ("..." if len(response_without) > 300 else "") + "\n")
             
             # Response with memory
-            print(f"\n🧠 Personalized Response:")
-            response_with = chatbot.get_response(query, use_memory=True)
-            print(response_with[:300] + ("..." if len(response_with) > 300 else ""))
+            buf.write("\n🧠 Personalized Response:\n")
+            buf.write(response_with[:300] + ("..." if len(response_with) > 300 else "") + "\n")
             
-            print("\n" + "=" * 50)
+            buf.write("\n" + "=" * 50 + "\n")
+            sys.stdout.write(buf.getvalue())
         
         print("\n✨ Notice how the personalized responses:")
         print("   • Use your preferred communication style")
@@ -7,10 +7,10 @@ Script to set up the memory system with initial configuration and validation.
 
 import sys
 import logging
-from pathlib import Path
+import os
 
 # Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.claude_client import ClaudeClient
 from src.memory_manager import MemoryManager
@@ -6,34 +6,59 @@ Main script for processing chat logs and updating memory using Claude analysis.
 """
 
 import sys
+import atexit
 import argparse
+import itertools
 import logging
-from pathlib import Path
+import logging.handlers
+import os
 from datetime import datetime
+from typing import Iterable, Iterator
 
 # Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.claude_client import ClaudeClient
-from src.memory_manager import MemoryManager
-from src.log_processor import LogProcessor
 from config import validate_config, ensure_directories
 
 
 def setup_logging(verbose: bool = False) -> None:
     """Setup logging configuration"""
     level = logging.DEBUG if verbose else logging.INFO
+    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    
+    # Buffer file records and write them in batches (immediately on errors)
+    file_handler = logging.FileHandler('memory_processing.log', delay=True)
+    file_handler.setFormatter(logging.Formatter(log_format))
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=200,
+        flushLevel=logging.ERROR,
+        target=file_handler
+    )
+    atexit.register(memory_handler.flush)
     
     logging.basicConfig(
         level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=log_format,
         handlers=[
             logging.StreamHandler(),
-            logging.FileHandler('memory_processing.log')
+            memory_handler
         ]
     )
 
 
+def _confirm(n: int, force: bool) -> bool:
+    """Ask the user to confirm applying n amendments (skipped with --force)"""
+    return force or input(f"\nApply {n} amendments to memory? (y/N): ").lower() == 'y'
+
+
+def _echo(chunks: Iterable[str]) -> Iterator[str]:
+    """Write streamed text chunks to stdout as they pass through"""
+    for chunk in chunks:
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
+        yield chunk
+
+
 def main():
     """Main function for processing logs and updating memory"""
     parser = argparse.ArgumentParser(
@@ -73,6 +98,11 @@ def main():
     
     args = parser.parse_args()
     
+    # Deferred so --help doesn't pay for importing the Anthropic SDK
+    from src.claude_client import ClaudeClient
+    from src.memory_manager import MemoryManager
+    from src.log_processor import LogProcessor
+    
     # Setup logging
     setup_logging(args.verbose)
     logger = logging.getLogger(__name__)
@@ -84,16 +114,9 @@ def main():
         ensure_directories()
         
         # Initialize components
-        claude_client = ClaudeClient()
         memory_manager = MemoryManager()
         log_processor = LogProcessor()
         
-        # Test Claude connection
-        logger.info("Testing Claude API connection...")
-        if not claude_client.test_connection():
-            logger.error("Failed to connect to Claude API")
-            return 1
-        
         # Load current memory
         logger.info("Loading current memory...")
         current_memory = memory_manager.load_memory()
@@ -102,34 +125,48 @@ def main():
         # Get logs to process
         if args.log_file:
             logger.info(f"Processing specific log file: {args.log_file}")
-            entries = log_processor.get_logs_by_file(args.log_file)
+            entries = iter(log_processor.get_logs_by_file(args.log_file))
         else:
             logger.info(f"Processing logs from last {args.days} days")
-            entries = log_processor.get_recent_logs(args.days)
+            entries = log_processor.iter_recent_logs(args.days)
         
-        if not entries:
+        # Entries stream into the formatter, which stops pulling them at
+        # MAX_LOG_CHARS; only peek at the first to check there is anything
+        first_entry = next(entries, None)
+        if first_entry is None:
             logger.warning("No log entries found to process")
             return 0
+        entries = itertools.chain([first_entry], entries)
         
-        logger.info(f"Found {len(entries)} log entries to analyze")
+        # Only set up Claude once there is something to analyze
+        claude_client = ClaudeClient()
         
-        # Analyze logs with Claude
+        logger.info("Testing Claude API connection...")
+        if not claude_client.test_connection():
+            logger.error("Failed to connect to Claude API")
+            return 1
+        
+        # Analyze logs with Claude, echoing the response as it streams in
         logger.info("Sending logs to Claude for analysis...")
-        analysis_response = log_processor.analyze_logs(
+        response_stream = log_processor.analyze_logs_stream(
             entries=entries,
             current_memory=current_memory,
             claude_client=claude_client
         )
         
-        logger.info("Received analysis from Claude")
+        print("\n=== Claude Analysis ===")
         
-        # Extract amendments from Claude's response
-        amendments = memory_manager.extract_amendments(analysis_response)
+        # Amendments are extracted as each diff block completes, not after the full response
+        amendments = []
+        for search_text, replace_text in memory_manager.iter_amendments(_echo(response_stream)):
+            amendments.append((search_text, replace_text))
+            logger.debug(f"Received amendment {len(amendments)} from Claude")
+        print()
+        
+        logger.info("Received analysis from Claude")
         
         if not amendments:
             logger.info("No memory amendments suggested by Claude")
-            print("\n=== Claude Analysis ===")
-            print(analysis_response)
             return 0
         
         logger.info(f"Claude suggested {len(amendments)} amendments")
@@ -141,20 +178,15 @@ def main():
             print(f"SEARCH: {search_text[:100]}{'...' if len(search_text) > 100 else ''}")
             print(f"REPLACE: {replace_text[:100]}{'...' if len(replace_text) > 100 else ''}")
         
-        print(f"\n=== Full Claude Analysis ===")
-        print(analysis_response)
-        
         # Apply amendments if not dry run
         if args.dry_run:
             logger.info("Dry run mode - no changes applied")
             print("\n[DRY RUN] No changes were applied to memory file")
         else:
             # Confirm before applying changes
-            if not args.force:
-                response = input(f"\nApply {len(amendments)} amendments to memory? (y/N): ")
-                if response.lower() != 'y':
-                    logger.info("User cancelled memory update")
-                    return 0
+            if not _confirm(len(amendments), args.force):
+                logger.info("User cancelled memory update")
+                return 0
             
             # Apply amendments
             logger.info("Applying amendments to memory...")
@@ -6,13 +6,15 @@ Script to test and demonstrate the effectiveness of the memory system
 with before/after comparisons of chatbot responses.
 """
 
+import io
 import sys
+import asyncio
 import logging
-from pathlib import Path
-from typing import List, Dict
+import os
+from typing import List, Tuple, Optional
 
 # Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.claude_client import ClaudeClient
 from src.memory_manager import MemoryManager
@@ -28,38 +30,33 @@ def setup_logging() -> None:
     )
 
 
-def get_test_queries() -> List[Dict[str, str]]:
-    """Get test queries to demonstrate memory effectiveness"""
-    return [
-        {
-            "query": "I need help with a Python API project. What's the best approach?",
-            "context": "General API development question"
-        },
-        {
-            "query": "How should I handle file uploads in my application?",
-            "context": "File handling question"
-        },
-        {
-            "query": "I want to set up CI/CD for my project. Any recommendations?",
-            "context": "DevOps and deployment question"
-        },
-        {
-            "query": "Can you help me with database design for user data?",
-            "context": "Database architecture question"
-        },
-        {
-            "query": "What's the best way to implement authentication?",
-            "context": "Security and authentication question"
-        }
-    ]
+# (query, description) pairs used to demonstrate memory effectiveness
+_TEST_QUERIES: Tuple[Tuple[str, str], ...] = (
+    ("I need help with a Python API project. What's the best approach?",
+     "General API development question"),
+    ("How should I handle file uploads in my application?",
+     "File handling question"),
+    ("I want to set up CI/CD for my project. Any recommendations?",
+     "DevOps and deployment question"),
+    ("Can you help me with database design for user data?",
+     "Database architecture question"),
+    ("What's the best way to implement authentication?",
+     "Security and authentication question"),
+)
 
 
-def generate_response(claude_client: ClaudeClient, query: str, context: str = "") -> str:
+def get_test_queries() -> Tuple[Tuple[str, str], ...]:
+    """Get (query, description) pairs to demonstrate memory effectiveness"""
+    return _TEST_QUERIES
+
+
+async def agenerate_response(claude_client: ClaudeClient, client, query: str, context: str = "") -> str:
     """
-    Generate a response using Claude
+    Generate a response using Claude's async API
     
     Args:
         claude_client: Initialized Claude client
+        client: AsyncAnthropic client (see ClaudeClient.create_async_client)
         query: User query
         context: Additional context (memory) to include
         
@@ -73,24 +70,34 @@ def generate_response(claude_client: ClaudeClient, query: str, context: str = ""
         else:
             prompt = f"User Question: {query}"
         
-        response = claude_client.client.messages.create(
-            model=claude_client.model,
-            max_tokens=1000,
-            temperature=0.1,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
-        )
-        
-        return response.content[0].text
+        return await claude_client.agenerate_text(client, prompt)
         
     except Exception as e:
         return f"Error generating response: {str(e)}"
 
 
+async def generate_comparison_responses(claude_client: ClaudeClient, queries: List[str], context: str) -> List[Tuple[str, str]]:
+    """
+    Generate responses with and without memory for all queries concurrently
+    
+    Args:
+        claude_client: Initialized Claude client
+        queries: User queries to answer
+        context: Memory context for the personalized responses
+        
+    Returns:
+        List of (response_without, response_with) tuples in query order
+    """
+    async with claude_client.create_async_client() as client:
+        responses = await asyncio.gather(*[
+            agenerate_response(claude_client, client, query, with_context)
+            for query in queries
+            for with_context in ("", context)
+        ])
+    
+    return list(zip(responses[::2], responses[1::2]))
+
+
 def run_comparison_test(claude_client: ClaudeClient, memory_manager: MemoryManager) -> None:
     """Run before/after comparison test"""
     
@@ -104,26 +111,32 @@ def run_comparison_test(claude_client: ClaudeClient, memory_manager: MemoryManag
     # Get test queries
     test_queries = get_test_queries()
     
-    for i, test_case in enumerate(test_queries, 1):
-        query = test_case["query"]
-        description = test_case["context"]
-        
-        print(f"\n--- Test Case {i}: {description} ---")
-        print(f"Query: {query}")
+    # Fan out all API calls up front; results are printed in order below
+    print("\nGenerating responses...")
+    responses = asyncio.run(generate_comparison_responses(
+        claude_client,
+        [query for query, _ in test_queries],
+        user_context
+    ))
+    
+    for i, ((query, description), (response_without, response_with)) in enumerate(zip(test_queries, responses), 1):
+        # Build each test case report in memory and write it once
+        buf = io.StringIO()
+        buf.write(f"\n--- Test Case {i}: {description} ---\n")
+        buf.write(f"Query: {query}\n")
         
-        # Generate response WITHOUT memory context
-        print("\n🤖 Response WITHOUT Memory:")
-        print("-" * 40)
-        response_without = generate_response(claude_client, query)
-        print(response_without[:500] + ("..." if len(response_without) > 500 else ""))
+        # Response WITHOUT memory context
+        buf.write("\n🤖 Response WITHOUT Memory:\n")
+        buf.write("-" * 40 + "\n")
+        buf.write(response_without[:500] + ("..." if len(response_without) > 500 else "") + "\n")
         
-        # Generate response WITH memory context
-        print(f"\n🧠 Response WITH Memory:")
-        print("-" * 40)
-        response_with = generate_response(claude_client, query, user_context)
-        print(response_with[:500] + ("..." if len(response_with) > 500 else ""))
+        # Response WITH memory context
+        buf.write("\n🧠 Response WITH Memory:\n")
+        buf.write("-" * 40 + "\n")
+        buf.write(response_with[:500] + ("..." if len(response_with) > 500 else "") + "\n")
         
-        print("\n" + "=" * 60)
+        buf.write("\n" + "=" * 60 + "\n")
+        sys.stdout.write(buf.getvalue())
 
 
 def run_memory_analysis_test(log_processor: LogProcessor, memory_manager: MemoryManager, claude_client: ClaudeClient) -> None:
@@ -185,14 +198,22 @@ def run_memory_analysis_test(log_processor: LogProcessor, memory_manager: Memory
         print(f"\n❌ Error during memory analysis: {str(e)}")
 
 
-def run_system_health_check() -> bool:
-    """Run comprehensive system health check"""
+def run_system_health_check() -> Tuple[bool, Optional[ClaudeClient], Optional[LogProcessor]]:
+    """
+    Run comprehensive system health check
+    
+    Returns:
+        Tuple of (all checks passed, Claude client, log processor), the latter
+        two as created during the check (None if it failed before them)
+    """
     
     print("\n" + "=" * 60)
     print("🏥 SYSTEM HEALTH CHECK")
     print("=" * 60)
     
     all_good = True
+    claude_client = None
+    log_processor = None
     
     try:
         # Test 1: Configuration
@@ -238,11 +259,11 @@ def run_system_health_check() -> bool:
         else:
             print("   ⚠️  Logs directory not found or empty")
         
-        return all_good
+        return all_good, claude_client, log_processor
         
     except Exception as e:
         print(f"\n❌ Health check failed: {str(e)}")
-        return False
+        return False, claude_client, log_processor
 
 
 def main():
@@ -255,14 +276,14 @@ def main():
     
     try:
         # Run health check first
-        if not run_system_health_check():
+        healthy, claude_client, log_processor = run_system_health_check()
+        if not healthy:
             print("\n❌ System health check failed. Please fix issues before running tests.")
             return 1
         
-        # Initialize components
-        claude_client = ClaudeClient()
+        # Initialize components (reusing the health check's Claude client and
+        # log processor, whose log stats and parses are already cached)
         memory_manager = MemoryManager()
-        log_processor = LogProcessor()
         
         # Run comparison test
         run_comparison_test(claude_client, memory_manager)
@@ -5,15 +5,34 @@ A simple system for managing LLM memory through text-based storage
 and automated conversation analysis.
 """
 
+import os
+import sys
+
 __version__ = "1.0.0"
 __author__ = "LLM Memory System"
 
-# Import handling for the memory system
-try:
-    from .memory_manager import MemoryManager
-    from .log_processor import LogProcessor
-    from .claude_client import ClaudeClient
-    __all__ = ["MemoryManager", "LogProcessor", "ClaudeClient"]
-except ImportError:
-    # Handle case where dependencies aren't installed
-    __all__ = []
+# Put the project root (home of config.py) first on the path for the submodules,
+# ahead of any host application's own config module. Done once here, and only if
+# it isn't already first, so sys.path doesn't grow per import.
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if sys.path[:1] != [_PROJECT_ROOT]:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+__all__ = ["MemoryManager", "LogProcessor", "ClaudeClient"]
+
+
+def __getattr__(name):
+    """Lazily import public classes so heavy dependencies load on first use"""
+    if name == "MemoryManager":
+        from .memory_manager import MemoryManager
+        globals()[name] = MemoryManager
+        return MemoryManager
+    if name == "LogProcessor":
+        from .log_processor import LogProcessor
+        globals()[name] = LogProcessor
+        return LogProcessor
+    if name == "ClaudeClient":
+        from .claude_client import ClaudeClient
+        globals()[name] = ClaudeClient
+        return ClaudeClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
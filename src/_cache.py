@@ -0,0 +1,72 @@
+"""
+Response Cache for LLM Memory System
+
+On-disk memoization of Claude responses for repeated development runs.
+Disabled unless the MEM_CACHE=1 environment variable is set.
+"""
+
+import os
+import json
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+from config import RESPONSE_CACHE_DIR, is_response_cache_enabled
+
+logger = logging.getLogger(__name__)
+
+
+def _cache_path(key_parts: Any) -> Path:
+    """Get the cache file path for a key"""
+    digest = hashlib.sha256(repr(key_parts).encode("utf-8")).hexdigest()
+    return RESPONSE_CACHE_DIR / f"{digest}.json"
+
+
+def _read_cached(path: Path) -> Optional[str]:
+    """Read a cached response, returning None on a miss or unreadable entry"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)["response"]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache entry {path}: {str(e)}")
+        return None
+
+
+def _write_cached(path: Path, response: str) -> None:
+    """Atomically write a response to the cache"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".json.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"response": response}, f)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning(f"Failed to write cache entry {path}: {str(e)}")
+
+
+async def acached_call(fn: Callable[[], Awaitable[str]], *, key_parts: Any) -> str:
+    """
+    Return a cached response for key_parts, awaiting fn on a miss
+    
+    Args:
+        fn: Zero-argument function returning an awaitable of the response text
+        key_parts: Hashable description of the request (model, prompt, ...)
+        
+    Returns:
+        Cached or freshly generated response text
+    """
+    if not is_response_cache_enabled():
+        return await fn()
+    
+    path = _cache_path(key_parts)
+    cached = _read_cached(path)
+    if cached is not None:
+        logger.debug(f"Response cache hit: {path.name}")
+        return cached
+    
+    response = await fn()
+    _write_cached(path, response)
+    return response
@@ -5,26 +5,27 @@ Handles communication with Anthropic's Claude API for memory analysis and update
 """
 
 import os
+import time
+import hashlib
 import logging
-from typing import Optional, Dict, Any
-from anthropic import Anthropic
+from typing import Optional, Dict, Any, List, Tuple, Iterator
+from anthropic import Anthropic, AsyncAnthropic
 from anthropic.types import Message
 
-import sys
-from pathlib import Path
-
-# Add parent directory to path for config import
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from config import (
-    ANTHROPIC_API_KEY,
+    get_anthropic_api_key,
     CLAUDE_MODEL,
     CLAUDE_MAX_TOKENS,
-    CLAUDE_TEMPERATURE
+    CLAUDE_TEMPERATURE,
+    BATCH_POLL_INTERVAL
 )
+from ._cache import acached_call
 
 logger = logging.getLogger(__name__)
 
+# Stands in for {{LOGS}} in the cached system prompt; the logs follow as the user message
+_LOGS_REFERENCE = "[The conversation logs are provided in the user message]"
+
 
 class ClaudeClient:
     """Client for interacting with Anthropic's Claude API"""
@@ -37,15 +38,65 @@ class ClaudeClient:
             api_key: Anthropic API key (defaults to config)
             model: Claude model to use (defaults to config)
         """
-        self.api_key = api_key or ANTHROPIC_API_KEY
+        self.api_key = api_key or get_anthropic_api_key()
         self.model = model or CLAUDE_MODEL
         
         if not self.api_key:
             raise ValueError("Anthropic API key is required. Set ANTHROPIC_API_KEY environment variable.")
         
         self.client = Anthropic(api_key=self.api_key)
+        self._model_info: Optional[Dict[str, Any]] = None
+        self._connected: Optional[bool] = None
+        
+        # Hash of the cacheable prompt prefix (template + memory) from the last analysis
+        self._cache_key: Optional[str] = None
         logger.info(f"Initialized Claude client with model: {self.model}")
     
+    def create_async_client(self) -> AsyncAnthropic:
+        """
+        Create an async Anthropic client for issuing concurrent requests
+        
+        A new client is returned on each call since its connection pool is
+        bound to the event loop it is first used in.
+        
+        Returns:
+            AsyncAnthropic client configured with the same API key
+        """
+        return AsyncAnthropic(api_key=self.api_key)
+    
+    async def agenerate_text(self, client: AsyncAnthropic, prompt: str,
+                             max_tokens: int = 1000, temperature: float = 0.1) -> str:
+        """
+        Generate a reply to a single user prompt with an async client
+        
+        Served from the on-disk response cache when MEM_CACHE=1.
+        
+        Args:
+            client: AsyncAnthropic client (see create_async_client)
+            prompt: User prompt text
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            
+        Returns:
+            Claude's response text
+        """
+        # Request parameters, shared by the API call and the cache key
+        params = {"model": self.model, "max_tokens": max_tokens, "temperature": temperature}
+        
+        async def create() -> str:
+            response = await client.messages.create(
+                **params,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ]
+            )
+            return response.content[0].text
+        
+        return await acached_call(create, key_parts=(sorted(params.items()), prompt))
+    
     def analyze_conversation(self, logs: str, current_memory: str, prompt_template: str) -> str:
         """
         Analyze conversation logs and propose memory amendments
@@ -62,28 +113,7 @@ class ClaudeClient:
             Exception: If API call fails
         """
         try:
-            # Format the prompt with logs and memory
-            formatted_prompt = prompt_template.replace("{{LOGS}}", logs)
-            formatted_prompt = formatted_prompt.replace("{{MEMORY}}", current_memory)
-            
-            logger.info(f"Sending analysis request to Claude ({self.model})")
-            logger.debug(f"Prompt length: {len(formatted_prompt)} characters")
-            
-            # Make API call to Claude
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=CLAUDE_MAX_TOKENS,
-                temperature=CLAUDE_TEMPERATURE,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": formatted_prompt
-                    }
-                ]
-            )
-            
-            # Extract response text
-            response_text = response.content[0].text
+            response_text = "".join(self.analyze_conversation_stream(logs, current_memory, prompt_template))
             
             logger.info("Successfully received response from Claude")
             logger.debug(f"Response length: {len(response_text)} characters")
@@ -94,45 +124,197 @@ class ClaudeClient:
             logger.error(f"Failed to analyze conversation with Claude: {str(e)}")
             raise Exception(f"Claude API error: {str(e)}")
     
+    def analyze_conversation_stream(self, logs: str, current_memory: str, prompt_template: str) -> Iterator[str]:
+        """
+        Stream Claude's analysis of conversation logs as text chunks arrive
+        
+        Callers can start processing (e.g. MemoryManager.iter_amendments)
+        before generation has finished.
+        
+        Args:
+            logs: Formatted conversation logs
+            current_memory: Current memory file content
+            prompt_template: Prompt template with placeholders
+            
+        Yields:
+            Response text chunks in order
+        """
+        system, messages = self._build_analysis_request(logs, current_memory, prompt_template)
+        
+        logger.info(f"Sending analysis request to Claude ({self.model})")
+        logger.debug(f"Prompt length: {sum(len(block['text']) for block in system) + len(messages[0]['content'])} characters")
+        
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=CLAUDE_MAX_TOKENS,
+            temperature=CLAUDE_TEMPERATURE,
+            system=system,
+            messages=messages
+        ) as stream:
+            for text in stream.text_stream:
+                yield text
+            
+            usage = stream.get_final_message().usage
+            logger.debug(
+                f"Prompt cache: {getattr(usage, 'cache_read_input_tokens', 0) or 0} tokens read, "
+                f"{getattr(usage, 'cache_creation_input_tokens', 0) or 0} tokens written"
+            )
+    
+    def analyze_conversations_batch(self, jobs: List[Tuple[str, str]], current_memory: str, prompt_template: str,
+                                    poll_interval: float = BATCH_POLL_INTERVAL) -> Dict[str, str]:
+        """
+        Analyze several sets of conversation logs with one Message Batches request
+        
+        Batches are processed asynchronously at a lower price, which suits
+        offline runs over many log windows. This call blocks, polling until
+        the batch has ended.
+        
+        Args:
+            jobs: List of (custom_id, formatted logs) pairs
+            current_memory: Current memory file content (shared by all jobs)
+            prompt_template: Prompt template with placeholders
+            poll_interval: Seconds to wait between status checks
+            
+        Returns:
+            Dictionary mapping custom_id to Claude's response for successful jobs
+            
+        Raises:
+            Exception: If the batch cannot be created or polled
+        """
+        if not jobs:
+            return {}
+        
+        try:
+            requests = []
+            for custom_id, logs in jobs:
+                system, messages = self._build_analysis_request(logs, current_memory, prompt_template)
+                requests.append({
+                    "custom_id": custom_id,
+                    "params": {
+                        "model": self.model,
+                        "max_tokens": CLAUDE_MAX_TOKENS,
+                        "temperature": CLAUDE_TEMPERATURE,
+                        "system": system,
+                        "messages": messages
+                    }
+                })
+            
+            batch = self.client.messages.batches.create(requests=requests)
+            logger.info(f"Submitted analysis batch {batch.id} with {len(requests)} requests")
+            
+            while batch.processing_status != "ended":
+                time.sleep(poll_interval)
+                batch = self.client.messages.batches.retrieve(batch.id)
+                logger.debug(f"Batch {batch.id} status: {batch.processing_status}")
+            
+            responses = {}
+            for result in self.client.messages.batches.results(batch.id):
+                if result.result.type == "succeeded":
+                    responses[result.custom_id] = result.result.message.content[0].text
+                else:
+                    logger.warning(f"Batch request {result.custom_id} did not succeed: {result.result.type}")
+            
+            logger.info(f"Received {len(responses)}/{len(requests)} batch responses from Claude")
+            return responses
+            
+        except Exception as e:
+            logger.error(f"Failed to analyze conversations with Claude batch: {str(e)}")
+            raise Exception(f"Claude API error: {str(e)}")
+    
+    def _build_analysis_request(self, logs: str, current_memory: str, prompt_template: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Split an analysis prompt into cacheable system blocks and a volatile user message
+        
+        The template (with {{LOGS}} replaced by a reference) and the memory are
+        sent as system blocks ending in a prompt-caching breakpoint, so repeated
+        analyses against the same memory only pay full price for the new logs.
+        
+        The API only caches prefixes of at least 2048 tokens on Haiku models
+        (1024 on Sonnet/Opus) and silently ignores shorter ones. With a small
+        memory file the logged cache read/write counts are therefore zero.
+        
+        Args:
+            logs: Formatted conversation logs
+            current_memory: Current memory file content
+            prompt_template: Prompt template with placeholders
+            
+        Returns:
+            Tuple of (system blocks, messages) for messages.create
+        """
+        template = prompt_template.replace("{{LOGS}}", _LOGS_REFERENCE)
+        
+        if "{{MEMORY}}" in template:
+            # Static template text up to the memory, then memory plus the remainder.
+            # One breakpoint after the memory: the template alone is far below the
+            # minimum cacheable length.
+            template_prefix, template_suffix = template.split("{{MEMORY}}", 1)
+            template_suffix = template_suffix.replace("{{MEMORY}}", current_memory)
+            system = [
+                {"type": "text", "text": template_prefix},
+                {"type": "text", "text": current_memory + template_suffix, "cache_control": {"type": "ephemeral"}}
+            ]
+        else:
+            system = [
+                {"type": "text", "text": template, "cache_control": {"type": "ephemeral"}}
+            ]
+        
+        # The API rejects empty text blocks (e.g. a template starting with {{MEMORY}})
+        system = [block for block in system if block["text"]]
+        
+        cache_key = hashlib.sha256("".join(block["text"] for block in system).encode("utf-8")).hexdigest()
+        if cache_key != self._cache_key:
+            logger.debug("Prompt prefix changed since last analysis; expecting a cache write")
+        self._cache_key = cache_key
+        
+        messages = [
+            {
+                "role": "user",
+                "content": f"<logs>\n{logs}\n</logs>"
+            }
+        ]
+        
+        return system, messages
+    
     def test_connection(self) -> bool:
         """
         Test connection to Claude API
         
+        Uses the free models endpoint rather than a billable generation, and
+        caches the result for the lifetime of the client.
+        
         Returns:
             True if connection successful, False otherwise
         """
+        if self._connected is not None:
+            return self._connected
+        
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=10,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": "Hello"
-                    }
-                ]
-            )
-            
+            self.client.models.retrieve(self.model)
             logger.info("Claude API connection test successful")
-            return True
+            self._connected = True
             
         except Exception as e:
             logger.error(f"Claude API connection test failed: {str(e)}")
-            return False
+            self._connected = False
+        
+        return self._connected
     
     def get_model_info(self) -> Dict[str, Any]:
         """
         Get information about the current model configuration
         
         Returns:
-            Dictionary with model configuration details
-        """
-        return {
-            "model": self.model,
-            "max_tokens": CLAUDE_MAX_TOKENS,
-            "temperature": CLAUDE_TEMPERATURE,
-            "api_key_configured": bool(self.api_key)
-        }
+            Dictionary with model configuration details (cached per client)
+        """
+        if self._model_info is None:
+            self._model_info = {
+                "model": self.model,
+                "max_tokens": CLAUDE_MAX_TOKENS,
+                "temperature": CLAUDE_TEMPERATURE,
+                "api_key_configured": bool(self.api_key)
+            }
+        
+        return self._model_info
     
     def estimate_tokens(self, text: str) -> int:
         """
@@ -159,13 +341,26 @@ class ClaudeClient:
         Returns:
             True if request size is acceptable, False otherwise
         """
-        total_text = logs + memory + prompt_template
-        estimated_tokens = self.estimate_tokens(total_text)
+        # Sum the lengths rather than concatenating (and copying) the full prompt
+        estimated_tokens = (len(logs) + len(memory) + len(prompt_template)) // 4
         
         # Claude 3.5 Haiku has a 200k token context window
         # Leave room for response tokens
         max_input_tokens = 190000
         
+        # The estimate is rough, so ask the API for an exact count near the limit
+        if estimated_tokens >= max_input_tokens * 0.95:
+            try:
+                system, messages = self._build_analysis_request(logs, memory, prompt_template)
+                estimated_tokens = self.client.messages.count_tokens(
+                    model=self.model,
+                    system=system,
+                    messages=messages
+                ).input_tokens
+                logger.debug(f"Exact request size from token counting: {estimated_tokens} tokens")
+            except Exception as e:
+                logger.warning(f"Token counting failed, using estimate: {str(e)}")
+        
         if estimated_tokens > max_input_tokens:
             logger.warning(f"Request size ({estimated_tokens} tokens) exceeds recommended limit")
             return False
@@ -4,24 +4,23 @@ Log Processor for LLM Memory System
 Handles parsing and processing of chat log files for memory analysis.
 """
 
+import os
 import re
+import copy
+import heapq
+import itertools
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple, Any
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Optional, Tuple, Any, Iterator, Iterable
 import yaml
 
-import sys
-from pathlib import Path
-
-# Add parent directory to path for config import
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from config import (
     LOGS_DIR,
     PROMPTS_FILE,
     LOG_DATE_FORMAT,
-    LOG_LINE_PATTERN,
+    LOG_LINE_RE,
     DEFAULT_LOG_DAYS,
     MIN_CONVERSATION_LENGTH,
     MAX_LOG_CHARS
@@ -29,6 +28,139 @@ from config import (
 
 logger = logging.getLogger(__name__)
 
+# Date embedded in a log file name, e.g. "2024-03-14.log"
+_FNAME_DATE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+
+def _fast_parse_ts(timestamp_str: str) -> datetime:
+    """
+    Parse a log timestamp without strptime's per-call format parsing
+    
+    Slices fixed positions, which assumes LOG_DATE_FORMAT is
+    "%Y-%m-%d %H:%M:%S"; anything else falls back to strptime.
+    
+    Args:
+        timestamp_str: Timestamp string from a log line
+        
+    Returns:
+        Parsed datetime
+        
+    Raises:
+        ValueError: If the timestamp is invalid
+    """
+    if LOG_DATE_FORMAT == "%Y-%m-%d %H:%M:%S" and len(timestamp_str) == 19:
+        try:
+            return datetime(
+                int(timestamp_str[0:4]), int(timestamp_str[5:7]), int(timestamp_str[8:10]),
+                int(timestamp_str[11:13]), int(timestamp_str[14:16]), int(timestamp_str[17:19])
+            )
+        except ValueError:
+            pass
+    
+    return datetime.strptime(timestamp_str, LOG_DATE_FORMAT)
+
+
+def _filename_date(log_file: Path) -> Optional[date]:
+    """
+    Get the date encoded in a log file's name, if any
+    
+    Args:
+        log_file: Path to log file
+        
+    Returns:
+        Date from the file name, or None if it has no valid date
+    """
+    match = _FNAME_DATE.search(log_file.name)
+    if not match:
+        return None
+    
+    try:
+        return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+    except ValueError:
+        return None
+
+
+def _iter_log_entries(lines: Iterable[str], cutoff: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield structured entries from log file lines
+    
+    Lines that don't start a new entry are continuation lines of a
+    multi-line message and are appended to the preceding entry.
+    
+    Args:
+        lines: Log file lines
+        cutoff: If given, skip entries with timestamps before it
+        
+    Yields:
+        Conversation entries with timestamp, role, and content
+    """
+    current = None
+    message_lines = []
+    
+    for line in lines:
+        line = line.rstrip('\n')
+        
+        # Every entry line contains "] ", so most continuation lines skip the regex
+        match = LOG_LINE_RE.match(line) if '] ' in line else None
+        if match is None:
+            if current is not None:
+                message_lines.append(line)
+            continue
+        
+        if current is not None:
+            current['content'] = "\n".join(message_lines).strip()
+            yield current
+            current = None
+        
+        timestamp_str, role, message = match.groups()
+        try:
+            timestamp = _fast_parse_ts(timestamp_str)
+        except ValueError as e:
+            logger.warning(f"Failed to parse timestamp '{timestamp_str}': {e}")
+            continue
+        
+        if cutoff is not None and timestamp < cutoff:
+            continue
+        
+        current = {
+            'timestamp': timestamp,
+            'role': role.upper(),
+            'content': ''
+        }
+        message_lines = [message]
+    
+    if current is not None:
+        current['content'] = "\n".join(message_lines).strip()
+        yield current
+
+
+def _read_log_entries(log_file: Path, cutoff: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """
+    Read and parse a log file line by line (no caching or error handling)
+    
+    Args:
+        log_file: Path to log file
+        cutoff: If given, skip entries with timestamps before it
+        
+    Returns:
+        List of conversation entries
+    """
+    with open(log_file, 'r', encoding='utf-8') as f:
+        return list(_iter_log_entries(f, cutoff))
+
+
+def _parse_log_file_worker(log_file: Path) -> Optional[List[Dict[str, Any]]]:
+    """
+    Process pool worker: parse a log file, returning None on failure
+    
+    Failures are retried serially by the caller so errors are logged in
+    the parent process.
+    """
+    try:
+        return _read_log_entries(log_file)
+    except Exception:
+        return None
+
 
 class LogProcessor:
     """Processes chat logs for memory analysis"""
@@ -44,6 +176,12 @@ class LogProcessor:
         self.logs_dir = logs_dir or LOGS_DIR
         self.prompts_file = prompts_file or PROMPTS_FILE
         
+        # Parsed entries per log file, keyed by path -> (mtime_ns, size, entries)
+        self._parse_cache: Dict[Path, Tuple[int, int, List[Dict[str, Any]]]] = {}
+        
+        # (logs directory signature, stats) from the last get_log_stats call
+        self._stats_cache: Optional[Tuple[Any, Dict[str, Any]]] = None
+        
         # Load prompts
         self.prompts = self._load_prompts()
         
@@ -71,12 +209,17 @@ class LogProcessor:
             logger.error(f"Failed to load prompts: {str(e)}")
             return {}
     
-    def parse_log_file(self, log_file: Path) -> List[Dict[str, str]]:
+    def parse_log_file(self, log_file: Path, cutoff: Optional[datetime] = None) -> List[Dict[str, str]]:
         """
         Parse a single log file into structured conversation data
         
+        Full parses are cached per file until its modification time or size
+        changes. With a cutoff, an uncached file is streamed and older entries
+        are dropped as they are read instead of being built and cached.
+        
         Args:
             log_file: Path to log file
+            cutoff: If given, only return entries at or after this time
             
         Returns:
             List of conversation entries with timestamp, role, and content
@@ -86,25 +229,20 @@ class LogProcessor:
                 logger.error(f"Log file not found: {log_file}")
                 return []
             
-            with open(log_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Parse log entries using regex
-            pattern = LOG_LINE_PATTERN
-            matches = re.findall(pattern, content, re.MULTILINE | re.DOTALL)
-            
-            entries = []
-            for timestamp_str, role, message in matches:
-                try:
-                    timestamp = datetime.strptime(timestamp_str, LOG_DATE_FORMAT)
-                    entries.append({
-                        'timestamp': timestamp,
-                        'role': role.upper(),
-                        'content': message.strip()
-                    })
-                except ValueError as e:
-                    logger.warning(f"Failed to parse timestamp '{timestamp_str}': {e}")
-                    continue
+            # Reuse the previous parse if the file is unchanged
+            st = log_file.stat()
+            cached = self._parse_cache.get(log_file)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                logger.debug(f"Using cached parse of {log_file}")
+                if cutoff is not None:
+                    return [entry for entry in cached[2] if entry['timestamp'] >= cutoff]
+                return list(cached[2])
+            
+            entries = _read_log_entries(log_file, cutoff)
+            
+            if cutoff is None:
+                self._parse_cache[log_file] = (st.st_mtime_ns, st.st_size, entries)
+                entries = list(entries)
             
             logger.info(f"Parsed {len(entries)} entries from {log_file}")
             return entries
@@ -113,6 +251,48 @@ class LogProcessor:
             logger.error(f"Failed to parse log file {log_file}: {str(e)}")
             return []
     
+    def _prime_parse_cache(self, log_files: List[Path]) -> None:
+        """
+        Parse uncached log files in parallel across CPU cores
+        
+        Each file's parse is pure CPU work, so separate processes avoid the
+        GIL. Small batches are left to parse_log_file, since pool startup
+        would cost more than it saves.
+        
+        Args:
+            log_files: Log files about to be parsed
+        """
+        pending = []
+        for log_file in log_files:
+            try:
+                st = log_file.stat()
+            except OSError:
+                continue
+            
+            cached = self._parse_cache.get(log_file)
+            if not (cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size):
+                pending.append((log_file, st))
+        
+        if len(pending) <= 2:
+            return
+        
+        logger.info(f"Parsing {len(pending)} log files in parallel")
+        try:
+            with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(pending))) as executor:
+                results = list(executor.map(
+                    _parse_log_file_worker,
+                    [log_file for log_file, _ in pending],
+                    chunksize=4
+                ))
+        except Exception as e:
+            logger.warning(f"Parallel log parsing failed, falling back to serial: {str(e)}")
+            return
+        
+        for (log_file, st), entries in zip(pending, results):
+            if entries is not None:
+                self._parse_cache[log_file] = (st.st_mtime_ns, st.st_size, entries)
+                logger.info(f"Parsed {len(entries)} entries from {log_file}")
+    
     def get_recent_logs(self, days: int = DEFAULT_LOG_DAYS) -> List[Dict[str, str]]:
         """
         Get log entries from the last N days
@@ -123,33 +303,68 @@ class LogProcessor:
         Returns:
             List of recent conversation entries
         """
+        all_entries = list(self.iter_recent_logs(days))
+        
+        logger.info(f"Found {len(all_entries)} recent entries from last {days} days")
+        return all_entries
+    
+    def iter_recent_logs(self, days: int = DEFAULT_LOG_DAYS) -> Iterator[Dict[str, str]]:
+        """
+        Lazily yield log entries from the last N days in timestamp order
+        
+        Per-file results are merged lazily, so callers that stop early (e.g.
+        once a character budget is reached) never build the combined list.
+        
+        Args:
+            days: Number of days to look back
+            
+        Yields:
+            Recent conversation entries, oldest first
+        """
         cutoff_date = datetime.now() - timedelta(days=days)
-        all_entries = []
         
         # Process all log files in the directory
         if not self.logs_dir.exists():
             logger.warning(f"Logs directory not found: {self.logs_dir}")
-            return []
+            return
         
         log_files = list(self.logs_dir.glob("*.log"))
         logger.info(f"Found {len(log_files)} log files")
         
+        # Skip files whose name dates them before the cutoff without opening them.
+        # Allow one day of slack for conversations that run past midnight.
+        oldest_date = cutoff_date.date() - timedelta(days=1)
+        recent_files = []
         for log_file in log_files:
-            entries = self.parse_log_file(log_file)
-            
-            # Filter by date
-            recent_entries = [
-                entry for entry in entries 
-                if entry['timestamp'] >= cutoff_date
-            ]
-            
-            all_entries.extend(recent_entries)
+            file_date = _filename_date(log_file)
+            if file_date is not None and file_date < oldest_date:
+                continue
+            recent_files.append(log_file)
+        if len(recent_files) < len(log_files):
+            logger.debug(f"Skipped {len(log_files) - len(recent_files)} log files dated before the cutoff")
+        log_files = recent_files
+        self._prime_parse_cache(log_files)
         
-        # Sort by timestamp
-        all_entries.sort(key=lambda x: x['timestamp'])
+        per_file_entries = (
+            self._iter_file_entries_since(log_file, cutoff_date)
+            for log_file in log_files
+        )
+        yield from heapq.merge(*per_file_entries, key=lambda x: x['timestamp'])
+    
+    def _iter_file_entries_since(self, log_file: Path, cutoff_date: datetime) -> Iterator[Dict[str, str]]:
+        """
+        Yield entries from a single log file at or after cutoff_date, sorted by timestamp
         
-        logger.info(f"Found {len(all_entries)} recent entries from last {days} days")
-        return all_entries
+        Args:
+            log_file: Path to log file
+            cutoff_date: Earliest timestamp to include
+            
+        Yields:
+            Conversation entries from the file
+        """
+        recent_entries = self.parse_log_file(log_file, cutoff=cutoff_date)
+        recent_entries.sort(key=lambda x: x['timestamp'])
+        yield from recent_entries
     
     def get_logs_by_file(self, filename: str) -> List[Dict[str, str]]:
         """
@@ -164,34 +379,75 @@ class LogProcessor:
         log_file = self.logs_dir / filename
         return self.parse_log_file(log_file)
     
-    def format_logs_for_analysis(self, entries: List[Dict[str, str]]) -> str:
+    def format_logs_for_analysis(self, entries: Iterable[Dict[str, Any]]) -> str:
         """
         Format log entries for Claude analysis
         
+        Entries may be a lazy iterator (e.g. iter_recent_logs); none are
+        pulled from it once the formatted text reaches MAX_LOG_CHARS.
+        
         Args:
-            entries: List of conversation entries
+            entries: Conversation entries in timestamp order
             
         Returns:
             Formatted string suitable for Claude analysis
         """
-        if not entries:
+        entries = iter(entries)
+        first_entry = next(entries, None)
+        if first_entry is None:
             return "No conversation logs provided."
         
         # Group entries into conversations (sessions)
-        conversations = self._group_into_conversations(entries)
+        conversations = self._group_into_conversations(itertools.chain([first_entry], entries))
         
+        # Lines are formatted lazily, so stopping at the limit skips the rest of the work
         formatted_logs = []
+        total_len = 0
+        for line in self._iter_formatted_lines(conversations):
+            # +1 for the newline joining this line to the previous one
+            line_len = len(line) + (1 if formatted_logs else 0)
+            if total_len + line_len > MAX_LOG_CHARS:
+                # Ensure we don't exceed Claude's context limits
+                logger.warning(f"Formatted logs exceed {MAX_LOG_CHARS} chars, truncating")
+                remaining = MAX_LOG_CHARS - total_len
+                if formatted_logs:
+                    formatted_logs[-1] += ("\n" + line)[:remaining]
+                else:
+                    formatted_logs.append(line[:remaining])
+                formatted_logs[-1] += "\n\n[Logs truncated due to length]"
+                break
+            formatted_logs.append(line)
+            total_len += line_len
+        
+        result = "\n".join(formatted_logs)
+        
+        logger.info(f"Formatted {len(result)} characters of conversation logs for analysis")
+        return result
+    
+    def _iter_formatted_lines(self, conversations: Iterable[List[Dict[str, Any]]]) -> Iterator[str]:
+        """
+        Yield the lines of the analysis text one at a time
+        
+        Args:
+            conversations: Conversations as returned by _group_into_conversations
+            
+        Yields:
+            Formatted lines, without trailing newlines
+        """
         for i, conversation in enumerate(conversations, 1):
             if len(conversation) < MIN_CONVERSATION_LENGTH:
                 continue  # Skip very short conversations
             
-            formatted_logs.append(f"=== Conversation {i} ===")
-            formatted_logs.append(f"Date: {conversation[0]['timestamp'].strftime('%Y-%m-%d')}")
-            formatted_logs.append(f"Duration: {len(conversation)} exchanges")
-            formatted_logs.append("")
+            yield f"=== Conversation {i} ==="
+            # Format dates/times directly; strftime is ~3x slower per call
+            start = conversation[0]['timestamp']
+            yield f"Date: {start.year:04d}-{start.month:02d}-{start.day:02d}"
+            yield f"Duration: {len(conversation)} exchanges"
+            yield ""
             
             for entry in conversation:
-                timestamp = entry['timestamp'].strftime('%H:%M:%S')
+                ts = entry['timestamp']
+                timestamp = f"{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}"
                 role = entry['role']
                 content = entry['content']
                 
@@ -199,64 +455,131 @@ class LogProcessor:
                 if len(content) > 1000:
                     content = content[:1000] + "... [truncated]"
                 
-                formatted_logs.append(f"[{timestamp}] {role}: {content}")
+                yield f"[{timestamp}] {role}: {content}"
             
-            formatted_logs.append("")
+            yield ""
+    
+    def _group_into_conversations(self, entries: Iterable[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Group log entries into conversation sessions
         
-        result = "\n".join(formatted_logs)
+        Entries are consumed lazily and each session is yielded once the next
+        one starts, so only the current session is held in memory.
+        
+        Args:
+            entries: Conversation entries in timestamp order
+            
+        Yields:
+            Conversation sessions (each session is a list of entries)
+        """
+        # Start a new conversation wherever there's a large time gap (>1 hour)
+        max_gap = timedelta(hours=1)
+        conversation = []
+        prev_ts = None
         
-        # Ensure we don't exceed Claude's context limits
-        if len(result) > MAX_LOG_CHARS:
-            logger.warning(f"Formatted logs ({len(result)} chars) exceed limit, truncating")
-            result = result[:MAX_LOG_CHARS] + "\n\n[Logs truncated due to length]"
+        for entry in entries:
+            ts = entry['timestamp']
+            if conversation and ts - prev_ts > max_gap:
+                yield conversation
+                conversation = []
+            conversation.append(entry)
+            prev_ts = ts
         
-        logger.info(f"Formatted {len(conversations)} conversations for analysis")
-        return result
+        # Add the last conversation
+        if conversation:
+            yield conversation
     
-    def _group_into_conversations(self, entries: List[Dict[str, str]]) -> List[List[Dict[str, str]]]:
+    def analyze_logs(self, entries: Iterable[Dict[str, Any]], current_memory: str, claude_client) -> str:
         """
-        Group log entries into conversation sessions
+        Analyze logs using Claude and get memory amendments
         
         Args:
-            entries: List of conversation entries
+            entries: Conversation entries in timestamp order (list or lazy iterator)
+            current_memory: Current memory content
+            claude_client: Initialized Claude client
             
         Returns:
-            List of conversation sessions (each session is a list of entries)
+            Claude's analysis response
         """
-        if not entries:
-            return []
+        try:
+            prompt_template, formatted_logs = self._prepare_analysis(entries, current_memory, claude_client)
+            
+            # Send to Claude for analysis
+            response = claude_client.analyze_conversation(
+                logs=formatted_logs,
+                current_memory=current_memory,
+                prompt_template=prompt_template
+            )
+            
+            return response
+            
+        except Exception as e:
+            logger.error(f"Failed to analyze logs: {str(e)}")
+            raise
+    
+    def analyze_logs_stream(self, entries: Iterable[Dict[str, Any]], current_memory: str, claude_client) -> Iterator[str]:
+        """
+        Analyze logs using Claude, yielding the response as it is generated
         
-        conversations = []
-        current_conversation = []
+        Args:
+            entries: Conversation entries in timestamp order (list or lazy iterator)
+            current_memory: Current memory content
+            claude_client: Initialized Claude client
+            
+        Yields:
+            Claude's analysis response text chunks in order
+        """
+        prompt_template, formatted_logs = self._prepare_analysis(entries, current_memory, claude_client)
         
-        for entry in entries:
-            # Start new conversation if there's a large time gap (>1 hour)
-            if (current_conversation and 
-                entry['timestamp'] - current_conversation[-1]['timestamp'] > timedelta(hours=1)):
-                
-                if current_conversation:
-                    conversations.append(current_conversation)
-                current_conversation = [entry]
-            else:
-                current_conversation.append(entry)
+        yield from claude_client.analyze_conversation_stream(
+            logs=formatted_logs,
+            current_memory=current_memory,
+            prompt_template=prompt_template
+        )
+    
+    def _prepare_analysis(self, entries: Iterable[Dict[str, Any]], current_memory: str, claude_client) -> Tuple[str, str]:
+        """
+        Get the analysis prompt template and the formatted logs to send with it
         
-        # Add the last conversation
-        if current_conversation:
-            conversations.append(current_conversation)
+        Args:
+            entries: Conversation entries in timestamp order (list or lazy iterator)
+            current_memory: Current memory content
+            claude_client: Initialized Claude client
+            
+        Returns:
+            Tuple of (prompt template, formatted logs)
+            
+        Raises:
+            ValueError: If the augment-memory prompt is missing
+        """
+        # Get the augment-memory prompt
+        if 'augment-memory' not in self.prompts:
+            raise ValueError("augment-memory prompt not found in prompts file")
+        
+        prompt_template = self.prompts['augment-memory']
         
-        return conversations
+        # Format logs for analysis
+        formatted_logs = self.format_logs_for_analysis(entries)
+        
+        # Validate request size
+        if not claude_client.validate_request_size(formatted_logs, current_memory, prompt_template):
+            logger.warning("Request size too large, truncating logs")
+            # Truncate logs if too large
+            formatted_logs = formatted_logs[:MAX_LOG_CHARS//2]
+        
+        return prompt_template, formatted_logs
     
-    def analyze_logs(self, entries: List[Dict[str, str]], current_memory: str, claude_client) -> str:
+    def analyze_logs_many(self, entries_by_window: Dict[str, List[Dict[str, str]]], current_memory: str, claude_client) -> Dict[str, str]:
         """
-        Analyze logs using Claude and get memory amendments
+        Analyze several windows of logs in one Claude Message Batches request
         
         Args:
-            entries: List of conversation entries
+            entries_by_window: Mapping of window ID (e.g. a date) to its entries
             current_memory: Current memory content
             claude_client: Initialized Claude client
             
         Returns:
-            Claude's analysis response
+            Mapping of window ID to Claude's analysis response
         """
         try:
             # Get the augment-memory prompt
@@ -265,32 +588,35 @@ class LogProcessor:
             
             prompt_template = self.prompts['augment-memory']
             
-            # Format logs for analysis
-            formatted_logs = self.format_logs_for_analysis(entries)
-            
-            # Validate request size
-            if not claude_client.validate_request_size(formatted_logs, current_memory, prompt_template):
-                logger.warning("Request size too large, truncating logs")
-                # Truncate logs if too large
-                formatted_logs = formatted_logs[:MAX_LOG_CHARS//2]
+            jobs = []
+            for window_id, entries in entries_by_window.items():
+                formatted_logs = self.format_logs_for_analysis(entries)
+                
+                # Validate request size
+                if not claude_client.validate_request_size(formatted_logs, current_memory, prompt_template):
+                    logger.warning(f"Request size too large for window {window_id}, truncating logs")
+                    formatted_logs = formatted_logs[:MAX_LOG_CHARS//2]
+                
+                jobs.append((window_id, formatted_logs))
             
-            # Send to Claude for analysis
-            response = claude_client.analyze_conversation(
-                logs=formatted_logs,
+            return claude_client.analyze_conversations_batch(
+                jobs=jobs,
                 current_memory=current_memory,
                 prompt_template=prompt_template
             )
             
-            return response
-            
         except Exception as e:
-            logger.error(f"Failed to analyze logs: {str(e)}")
+            logger.error(f"Failed to analyze log windows: {str(e)}")
             raise
     
     def get_log_stats(self) -> Dict[str, Any]:
         """
         Get statistics about available log files
         
+        Results are cached until a log file is added, removed, or modified
+        (detected via the directory mtime and each file's mtime/size). Each
+        call returns a copy, so callers may modify it freely.
+        
         Returns:
             Dictionary with log file statistics
         """
@@ -299,6 +625,18 @@ class LogProcessor:
                 return {"logs_dir_exists": False}
             
             log_files = list(self.logs_dir.glob("*.log"))
+            
+            # Return cached stats if no log file changed since the last call
+            file_states = []
+            for log_file in log_files:
+                st = log_file.stat()
+                file_states.append((log_file.name, st.st_mtime_ns, st.st_size))
+            
+            signature = (self.logs_dir.stat().st_mtime_ns, tuple(sorted(file_states)))
+            if self._stats_cache and self._stats_cache[0] == signature:
+                return copy.deepcopy(self._stats_cache[1])
+            
+            self._prime_parse_cache(log_files)
             total_entries = 0
             date_range = {"earliest": None, "latest": None}
             
@@ -316,7 +654,7 @@ class LogProcessor:
                     if date_range["latest"] is None or file_latest > date_range["latest"]:
                         date_range["latest"] = file_latest
             
-            return {
+            stats = {
                 "logs_dir_exists": True,
                 "log_file_count": len(log_files),
                 "total_entries": total_entries,
@@ -326,6 +664,9 @@ class LogProcessor:
                 }
             }
             
+            self._stats_cache = (signature, stats)
+            return copy.deepcopy(stats)
+            
         except Exception as e:
             logger.error(f"Failed to get log stats: {str(e)}")
             return {"error": str(e)}
